@@ -11,7 +11,8 @@ import pickle
 import re
 import sys
 import threading
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import lru_cache
 
 # ✅ Correct Gemini import
 import google.generativeai as genai
@@ -25,6 +26,13 @@ from flask_cors import CORS
 from flask_mail import Mail, Message
 from flask_babel import Babel, gettext as _
 
+# Optional JIT for the forum filter kernel; everything falls back to the
+# pure-Python paths when numba is not installed.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 app = Flask(__name__)
 app.config["TEMPLATES_AUTO_RELOAD"] = True
 app.jinja_env.auto_reload = True
@@ -475,76 +483,380 @@ def filter_posts(posts_list, search=None, start_date=None, end_date=None):
         List of filtered posts
     """
     filtered = posts_list.copy()
-    
-    # Apply search filter (case-insensitive)
-    if search and search.strip():
-        search_lower = search.lower()
-        filtered = [p for p in filtered if search_lower in p.get('content', '').lower()]
-    
-    # Apply start_date filter
-    if start_date:
-        filtered = [p for p in filtered if parse_post_timestamp(p.get('timestamp')) >= start_date]
-    
-    # Apply end_date filter
-    if end_date:
-        filtered = [p for p in filtered if parse_post_timestamp(p.get('timestamp')) <= end_date]
-    
-    return filtered
+
+    # Lowercase the needle once up front instead of per post; for empty
+    # queries skip the substring check entirely.
+    needle = search.lower() if search else None
+    start_us = _datetime_us(start_date) if start_date is not None else None
+    end_us = _datetime_us(end_date) if end_date is not None else None
+
+    if needle is None:
+        if start_us is not None or end_us is not None:
+            # Date-only query: binary search the sorted timestamps rather
+            # than comparing every post.
+            index = _post_index(filtered)
+            filtered = [filtered[i] for i in index.date_select(start_us, end_us)]
+        return filtered
+
+    if len(filtered) >= _KERNEL_MIN_POSTS:
+        if _filter_kernel is not None:
+            # Large corpus: run the fused JIT kernel over the packed
+            # arrays, covering the substring scan and both date bounds in
+            # one nopython pass.
+            index = _post_index(filtered)
+            offsets, buf = index.packed_content()
+            needle_arr = np.frombuffer(needle.encode('utf-8'), dtype=np.uint8)
+            mask = _filter_kernel(
+                index.ts_us, offsets, buf, needle_arr,
+                _INT64_MIN if start_us is None else start_us,
+                _INT64_MAX if end_us is None else end_us)
+            return [filtered[i] for i in np.flatnonzero(mask)]
+        if '\x00' not in needle:
+            # No numba: batch the substring search through np.char.find,
+            # one C loop over the lowered-content array instead of a
+            # Python loop per post.
+            index = _post_index(filtered)
+            contents = index.lowered_array()
+            if contents is not None:
+                mask = np.char.find(contents, needle) >= 0
+                if start_us is not None:
+                    mask &= index.ts_us >= start_us
+                if end_us is not None:
+                    mask &= index.ts_us <= end_us
+                return [filtered[i] for i in np.flatnonzero(mask)]
+
+    # ASCII needles (the overwhelmingly common case) can match against
+    # bytes, where lower() is a byte-table lookup instead of a full
+    # Unicode case-fold.
+    needle_b = needle.encode('ascii') if needle.isascii() else None
+
+    if start_us is None and end_us is None:
+        return [p for p in filtered if _contains_ci(p, needle, needle_b)]
+
+    # Combined query: vectorize the date bounds into one mask over the
+    # shared index (mask intersection is a single vectorized AND), then
+    # extract the surviving indices in bulk and run the substring scan
+    # only on those — Python never iterates the masked-out posts.
+    index = _post_index(filtered)
+    mask = None
+    if start_us is not None:
+        mask = index.ts_us >= start_us
+    if end_us is not None:
+        end_mask = index.ts_us <= end_us
+        mask = end_mask if mask is None else mask & end_mask
+    return [p for p in (filtered[i] for i in np.flatnonzero(mask))
+            if _contains_ci(p, needle, needle_b)]
+
+
+# Lowered-content cache shared across filter_posts calls, so repeated
+# filters over the same corpus (the typical forum session) case-fold each
+# post only once. Keyed by the post dict's id() with the content object kept
+# alongside: a hit is validated by content identity, so a recycled id can
+# never serve a stale entry. Cleared wholesale when it grows too large.
+_content_lower_cache = {}
+_CONTENT_CACHE_MAX = 4096
+
+
+def _lowered_content(post):
+    """
+    Return the post's content lowered for matching, cached across calls.
+    Fully-ASCII content is cached as lowered bytes (cheap byte-table
+    lower, C memmem containment); anything else as a lowered str.
+    """
+    content = post.get('content', '')
+    entry = _content_lower_cache.get(id(post))
+    if entry is not None and entry[0] is content:
+        return entry[1]
+    if content.isascii():
+        lowered = content.encode('ascii').lower()
+    else:
+        lowered = content.lower()
+    if len(_content_lower_cache) >= _CONTENT_CACHE_MAX:
+        _content_lower_cache.clear()
+    _content_lower_cache[id(post)] = (content, lowered)
+    return lowered
 
 
+def _contains_ci(post, needle, needle_b):
+    """
+    Case-insensitive containment check for an already-lowered needle.
+
+    Deliberately not a precompiled re.IGNORECASE pattern: for literal
+    needles CPython's substring search (two-way with a bloom-filter skip)
+    outruns the regex engine at any needle length, the lowered haystack
+    is already cached across calls, and IGNORECASE disagrees with
+    lower()-containment on one-to-many Unicode foldings such as 'ß'/'SS'.
+    """
+    lowered = _lowered_content(post)
+    if type(lowered) is bytes:
+        # ASCII content: a non-ASCII needle can never match it.
+        return needle_b is not None and needle_b in lowered
+    return needle in lowered
+
+
+@lru_cache(maxsize=4096)
 def parse_post_timestamp(timestamp_str):
     """
     Parse ISO timestamp string to datetime object.
-    Handles timestamps with or without 'Z' suffix.
+    Handles timestamps with or without 'Z' suffix. Parses are memoized,
+    so a timestamp seen before costs a cache lookup instead of a parse.
     """
     if not timestamp_str:
         return datetime.min
-    
-    # Remove 'Z' suffix if present and parse
-    ts = timestamp_str.rstrip('Z')
+
+    # Drop a trailing 'Z' and parse as naive UTC. (3.11's fromisoformat
+    # would accept the 'Z' directly, but returns an aware datetime that
+    # can't be compared against the naive filter bounds.)
+    if timestamp_str[-1] == 'Z':
+        timestamp_str = timestamp_str[:-1]
     try:
-        return datetime.fromisoformat(ts)
+        return datetime.fromisoformat(timestamp_str)
     except ValueError:
         return datetime.min
 
 
+# Naive epoch reference for _datetime_us; keeping the arithmetic in naive
+# datetimes sidesteps local-timezone effects of datetime.timestamp().
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _datetime_us(dt):
+    """Convert a naive datetime to integer microseconds since the epoch."""
+    return (dt - _EPOCH) // _MICROSECOND
+
+
+class PostIndex:
+    """
+    Struct-of-arrays view over a list of post dicts: the timestamps are
+    parsed once into a parallel int64 array of epoch microseconds, so date
+    filtering becomes a vectorized integer compare instead of a datetime
+    parse per post per call. The post dicts themselves are snapshotted so
+    a cached index can be validated by element identity.
+
+    The posts stay plain dicts on purpose: they are the JSON wire format
+    of the API and the shape every fixture builds. The compact storage a
+    slotted Post class would buy lives here instead, in the columnar
+    arrays.
+    """
+
+    __slots__ = ('posts', 'ts_us', 'sort_perm', 'sorted_ts_us',
+                 '_content_offsets', '_content_buf', '_contents_lower')
+
+    def __init__(self, posts_list):
+        self.posts = list(posts_list)
+        self.ts_us = np.fromiter(
+            (_datetime_us(parse_post_timestamp(p.get('timestamp')))
+             for p in self.posts),
+            dtype=np.int64, count=len(self.posts))
+        # Sort permutation for binary-searched date ranges, built on the
+        # first date-only query.
+        self.sort_perm = None
+        self.sorted_ts_us = None
+        # Packed lowered contents for the JIT kernel, built on first use.
+        self._content_offsets = None
+        self._content_buf = None
+        # Lowered contents as a fixed-width NumPy string array for the
+        # vectorized find path; False once found unusable.
+        self._contents_lower = None
+
+    def lowered_array(self):
+        """
+        Return the lowered contents as a NumPy unicode array for
+        np.char.find, or None when the corpus can't be represented
+        faithfully (fixed-width U dtype silently drops trailing NULs).
+        """
+        if self._contents_lower is None:
+            lowered = []
+            for p in self.posts:
+                lc = _lowered_content(p)
+                if isinstance(lc, bytes):
+                    lc = lc.decode('ascii')
+                if '\x00' in lc:
+                    lowered = None
+                    break
+                lowered.append(lc)
+            self._contents_lower = (np.array(lowered, dtype=np.str_)
+                                    if lowered is not None else False)
+        return self._contents_lower if self._contents_lower is not False else None
+
+    def packed_content(self):
+        """
+        Return (offsets, buf): every post's lowered content UTF-8 encoded
+        into one contiguous uint8 buffer, delimited by an int64 offsets
+        array of length N+1. This is the string layout the numba kernel
+        can scan without touching Python objects.
+        """
+        if self._content_offsets is None:
+            offsets = np.empty(len(self.posts) + 1, dtype=np.int64)
+            offsets[0] = 0
+            parts = []
+            for i, p in enumerate(self.posts):
+                lowered = _lowered_content(p)
+                if not isinstance(lowered, bytes):
+                    lowered = lowered.encode('utf-8')
+                parts.append(lowered)
+                offsets[i + 1] = offsets[i] + len(lowered)
+            self._content_buf = np.frombuffer(b''.join(parts), dtype=np.uint8)
+            self._content_offsets = offsets
+        return self._content_offsets, self._content_buf
+
+    def date_select(self, start_us=None, end_us=None):
+        """
+        Return the original indices of posts within [start_us, end_us],
+        ascending. Locates the range with two binary searches on the
+        sorted timestamps instead of scanning every post.
+        """
+        if self.sort_perm is None:
+            self.sort_perm = np.argsort(self.ts_us, kind='stable')
+            self.sorted_ts_us = self.ts_us[self.sort_perm]
+        lo = 0 if start_us is None else np.searchsorted(self.sorted_ts_us, start_us, 'left')
+        hi = len(self.posts) if end_us is None else np.searchsorted(self.sorted_ts_us, end_us, 'right')
+        # Re-sort the selected indices so the caller's post order is kept.
+        return np.sort(self.sort_perm[lo:hi])
+
+    def matches(self, posts_list):
+        """Check that posts_list holds exactly the indexed post objects."""
+        return len(posts_list) == len(self.posts) and all(
+            a is b for a, b in zip(self.posts, posts_list))
+
+
+# Below this size the Python paths win; the kernel's call overhead (and
+# first-run compile) only pays off on larger corpora.
+_KERNEL_MIN_POSTS = 64
+
+_INT64_MIN = np.iinfo(np.int64).min
+_INT64_MAX = np.iinfo(np.int64).max
+
+if njit is not None:
+    @njit(cache=True)
+    def _filter_kernel(ts_us, offsets, buf, needle, start_us, end_us):
+        """
+        Fused filter over the packed post arrays: two int64 timestamp
+        compares plus a byte-level substring scan per post, all in
+        nopython mode. Returns a boolean keep-mask.
+        """
+        n = ts_us.shape[0]
+        m = needle.shape[0]
+        out = np.zeros(n, dtype=np.bool_)
+        # For long needles, build a Boyer-Moore-Horspool bad-character
+        # shift table once and reuse it across all N posts; short needles
+        # stay on the plain scan where the table build doesn't pay off.
+        use_bmh = m >= 8
+        shift = np.full(256, m, dtype=np.int64)
+        if use_bmh:
+            for k in range(m - 1):
+                shift[needle[k]] = m - 1 - k
+        for i in range(n):
+            if ts_us[i] < start_us or ts_us[i] > end_us:
+                continue
+            lo = offsets[i]
+            hi = offsets[i + 1] - m
+            if use_bmh:
+                j = lo
+                while j <= hi:
+                    k = m - 1
+                    while k >= 0 and buf[j + k] == needle[k]:
+                        k -= 1
+                    if k < 0:
+                        out[i] = True
+                        break
+                    j += shift[buf[j + m - 1]]
+            else:
+                for j in range(lo, hi + 1):
+                    k = 0
+                    while k < m and buf[j + k] == needle[k]:
+                        k += 1
+                    if k == m:
+                        out[i] = True
+                        break
+        return out
+else:
+    _filter_kernel = None
+
+
+# Most-recently built PostIndex; repeated filters over the same corpus (the
+# typical forum session) reuse it instead of re-parsing every timestamp.
+_post_index_cache = None
+
+
+def _post_index(posts_list):
+    """Return a PostIndex for posts_list, reusing the cached one if valid."""
+    global _post_index_cache
+    cached = _post_index_cache
+    if cached is not None and cached.matches(posts_list):
+        return cached
+    index = PostIndex(posts_list)
+    _post_index_cache = index
+    return index
+
+
+class PaginationResult:
+    """
+    Pagination result that quacks like the old dict ('posts', 'total',
+    'page', 'per_page', 'total_pages') but only materializes the page
+    slice on first access, so metadata-only consumers never pay for the
+    copy.
+    """
+    __slots__ = ('_source', '_start', '_end', '_page_posts',
+                 'total', 'page', 'per_page', 'total_pages')
+
+    def __init__(self, posts_list, page, per_page, total, total_pages):
+        self._source = posts_list
+        self._start = (page - 1) * per_page
+        self._end = self._start + per_page
+        self._page_posts = None
+        self.total = total
+        self.page = page
+        self.per_page = per_page
+        self.total_pages = total_pages
+
+    @property
+    def posts(self):
+        if self._page_posts is None:
+            if self._start == 0 and self._end >= self.total:
+                # The page covers the whole list: hand it back as-is
+                # instead of copying it through a slice.
+                self._page_posts = self._source
+            else:
+                self._page_posts = self._source[self._start:self._end]
+        return self._page_posts
+
+    def __getitem__(self, key):
+        if key == 'posts':
+            return self.posts
+        if key in ('total', 'page', 'per_page', 'total_pages'):
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self.posts)
+
+
 def paginate_posts(posts_list, page=1, per_page=10):
     """
     Paginate a list of posts.
-    
+
     Args:
         posts_list: List of posts to paginate
         page: Current page number (1-indexed)
         per_page: Number of posts per page
-    
+
     Returns:
-        dict: {
-            'posts': List of posts for current page,
-            'total': Total number of posts,
-            'page': Current page number,
-            'per_page': Posts per page,
-            'total_pages': Total number of pages
-        }
+        PaginationResult: dict-compatible result with keys
+            'posts' (posts for the current page, materialized lazily),
+            'total', 'page', 'per_page' and 'total_pages'.
     """
-    import math
-    
     total = len(posts_list)
-    total_pages = math.ceil(total / per_page) if total > 0 else 1
-    
-    # Ensure page is within valid range
-    page = max(1, min(page, total_pages))
-    
-    # Calculate slice indices
-    start_idx = (page - 1) * per_page
-    end_idx = start_idx + per_page
-    
-    return {
-        'posts': posts_list[start_idx:end_idx],
-        'total': total,
-        'page': page,
-        'per_page': per_page,
-        'total_pages': total_pages
-    }
+    # Integer ceil-division: no math.ceil call and no int->float
+    # roundtrip; the empty-list case folds into the max() instead of a
+    # separate branch.
+    total_pages = max(1, (total + per_page - 1) // per_page)
+
+    # Clamp page into [1, total_pages] with two compares, no calls.
+    page = 1 if page < 1 else (total_pages if page > total_pages else page)
+
+    return PaginationResult(posts_list, page, per_page, total, total_pages)
 
 
 @app.route('/forum')
@@ -0,0 +1,35 @@
+"""
+Shared pytest setup for the test suite.
+Feature: forum-search-filter
+"""
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Make the application importable from the repo root once, instead of each
+# test module inserting the path and re-touching app on collection.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app  # noqa: E402
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        'markers', 'slow: full-Unicode property variants, heavier to generate')
+
+
+@pytest.fixture(scope='session', autouse=True)
+def warm_filter_kernel():
+    """
+    Compile the optional numba filter kernel once up front, so the first
+    Hypothesis example never pays the JIT warm-up inside its deadline.
+    """
+    if app._filter_kernel is not None:
+        app._filter_kernel(np.zeros(1, dtype=np.int64),
+                           np.zeros(2, dtype=np.int64),
+                           np.zeros(1, dtype=np.uint8),
+                           np.zeros(1, dtype=np.uint8),
+                           app._INT64_MIN, app._INT64_MAX)
+    yield
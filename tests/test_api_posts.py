@@ -3,12 +3,9 @@ Unit tests for /api/posts endpoint.
 Feature: forum-search-filter
 """
 import json
-import os
-import sys
 
 import pytest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from app import app, posts
 
 